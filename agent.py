@@ -8,6 +8,7 @@ No rigid pre-planning - just continuous reasoning and tool usage until the task
 from typing import TypedDict, Annotated, Sequence, List, Dict, Any, Optional, AsyncGenerator
 import operator
 import json
+import asyncio
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from tools import PostgreSQLTools, create_langchain_tools
@@ -30,6 +31,9 @@ class AgentEvent:
     APPROVAL_NEEDED = "approval_needed"
     ERROR = "error"
 
+    # One instance per streamed event; slots keep them small
+    __slots__ = ("type", "data")
+
     def __init__(self, event_type: str, data: Any = None):
         self.type = event_type
         self.data = data or {}
@@ -51,6 +55,20 @@ class SQLAgent:
         # Bind tools to LLM
         self.llm_with_tools = self.llm.bind_tools(self.tools)
 
+    async def _run_tool(self, tool_name: str, tool_input: Optional[Dict[str, Any]]) -> str:
+        """Run a tool without blocking the event loop."""
+        tool = self.tool_map.get(tool_name)
+        if not tool:
+            return json.dumps({"error": f"Tool '{tool_name}' not found"})
+
+        kwargs = tool_input or {}
+        try:
+            if tool.coroutine:
+                return await tool.coroutine(**kwargs)
+            return await asyncio.to_thread(tool.func, **kwargs)
+        except Exception as e:
+            return json.dumps({"error": str(e)})
+
     def _create_system_prompt(self) -> str:
         """Create the system prompt for the agent."""
         return """You are an expert PostgreSQL database assistant. You help users explore databases and answer questions about their data.
@@ -157,14 +175,7 @@ Think step by step. Use tools. Get real data. Answer completely."""
                         "args": tool_input
                     })
 
-                    tool = self.tool_map.get(tool_name)
-                    if tool:
-                        try:
-                            result = tool.func(**tool_input) if tool_input else tool.func()
-                        except Exception as e:
-                            result = json.dumps({"error": str(e)})
-                    else:
-                        result = json.dumps({"error": f"Tool '{tool_name}' not found"})
+                    result = await self._run_tool(tool_name, tool_input)
 
                     yield AgentEvent(AgentEvent.TOOL_RESULT, {
                         "tool": tool_name,
@@ -232,7 +243,7 @@ Think step by step. Use tools. Get real data. Answer completely."""
             })
 
             try:
-                query_result = self.db_tools.execute_query(sql)
+                query_result = await self.db_tools.execute_query_async(sql)
             except Exception as e:
                 query_result = {"error": str(e)}
 
@@ -294,13 +305,7 @@ Think step by step. Use tools. Get real data. Answer completely."""
                         "args": tool_input
                     })
 
-                    tool = self.tool_map.get(tool_name)
-                    try:
-                        result = tool.func(**tool_input) if tool and tool_input else (
-                            tool.func() if tool else json.dumps({"error": "Tool not found"})
-                        )
-                    except Exception as e:
-                        result = json.dumps({"error": str(e)})
+                    result = await self._run_tool(tool_name, tool_input)
 
                     yield AgentEvent(AgentEvent.TOOL_RESULT, {
                         "tool": tool_name,
@@ -376,6 +381,17 @@ Think step by step. Use tools. Get real data. Answer completely."""
                     history.append({"role": "assistant", "content": msg.content})
         return history
 
+    def record_exchange(self, user_message: str, response: str, state: Optional[AgentState] = None) -> AgentState:
+        """Add a question answered outside the ReAct loop to the conversation."""
+        messages = list(state.get("messages", [])) if state else []
+        messages.append(HumanMessage(content=user_message))
+        messages.append(AIMessage(content=response))
+        return {
+            "messages": messages,
+            "pending_approval": None,
+            "db_connected": bool(self.db_tools.connection_params)
+        }
+
     @staticmethod
     def create_agent(provider: str, api_key: str, model: str, db_tools: PostgreSQLTools) -> 'SQLAgent':
         """Create an agent with specified provider."""
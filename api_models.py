@@ -11,6 +11,33 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client; model fetches reuse its pooled connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for provider API calls.
+
+    Returns:
+        httpx.AsyncClient instance
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=4, keepalive_expiry=60.0)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class ModelFetcher:
     """Fetch available models from AI provider APIs."""
@@ -70,21 +97,20 @@ class ModelFetcher:
         """
         if api_key:
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        "https://api.openai.com/v1/models",
-                        headers={"Authorization": f"Bearer {api_key}"},
-                        timeout=10.0
-                    )
-                    if response.status_code == 200:
-                        data = response.json()
-                        # Filter for chat models
-                        models = [
-                            m["id"] for m in data.get("data", [])
-                            if any(prefix in m["id"] for prefix in ["gpt-4", "gpt-3.5"])
-                        ]
-                        if models:
-                            return sorted(models)
+                response = await get_http_client().get(
+                    "https://api.openai.com/v1/models",
+                    headers={"Authorization": f"Bearer {api_key}"},
+                    timeout=10.0
+                )
+                if response.status_code == 200:
+                    data = response.json()
+                    # Filter for chat models
+                    models = [
+                        m["id"] for m in data.get("data", [])
+                        if any(prefix in m["id"] for prefix in ["gpt-4", "gpt-3.5"])
+                    ]
+                    if models:
+                        return sorted(models)
             except Exception as e:
                 logger.warning(f"Failed to fetch OpenAI models from API: {e}")
 
@@ -9,6 +9,7 @@ Features slash commands: /models, /db, /help, /clear
 from textual.app import App
 from textual.binding import Binding
 
+from api_models import close_http_client
 from tools import PostgreSQLTools
 from ui import ChatView
 
@@ -39,6 +40,10 @@ class SQLAgentApp(App):
         """Create the main interface."""
         yield ChatView(self.db_tools)
 
+    async def on_unmount(self) -> None:
+        """Release the shared HTTP client used for model fetches."""
+        await close_http_client()
+
     def action_quit(self) -> None:
         """Quit the application."""
         self.exit()
@@ -13,6 +13,13 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Provider name -> environment variable holding its API key
+API_KEY_ENV_VARS = {
+    "google": "GOOGLE_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+}
+
 
 class Config:
     """Application configuration manager."""
@@ -87,14 +94,7 @@ class Config:
         """
         provider = provider.lower()
 
-        # Environment variable mapping
-        env_vars = {
-            "google": "GOOGLE_API_KEY",
-            "openai": "OPENAI_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-        }
-
-        env_var = env_vars.get(provider)
+        env_var = API_KEY_ENV_VARS.get(provider)
         if env_var:
             api_key = os.getenv(env_var)
             if api_key:
@@ -115,6 +115,24 @@ class Config:
         self._config[f"{provider}_api_key"] = api_key
         self._save_config()
 
+    def save_model_selection(self, provider: str, api_key: str, model: str) -> None:
+        """
+        Save a provider's API key and make it and its model the last used.
+
+        Same as set_api_key, set_last_provider and set_last_model, but the
+        config file is written once instead of three times.
+
+        Args:
+            provider: Provider name
+            api_key: API key to save
+            model: Selected model
+        """
+        provider = provider.lower()
+        self._config[f"{provider}_api_key"] = api_key
+        self._config["last_provider"] = provider
+        self._config[f"last_model_{provider}"] = model
+        self._save_config()
+
     def get_db_connection(self) -> Optional[Dict[str, str]]:
         """
         Get database connection parameters.
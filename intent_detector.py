@@ -14,6 +14,42 @@ from tools import PostgreSQLTools
 import json
 
 
+# Each intent's phrasings, combined into one alternation. Alternatives are
+# tried in order, as the separate patterns used to be.
+_LIST_SCHEMAS_RE = re.compile(
+    r'^(?:list\s+schemas?'
+    r'|show\s+schemas?'
+    r'|what\s+schemas?\s*(?:are there|exist|do i have)?'
+    r'|schemas?'
+    r'|get\s+schemas?)$'
+)
+
+_LIST_TABLES_RE = re.compile(
+    r'^(?:list\s+(?:all\s+)?tables?'
+    r'|show\s+(?:all\s+)?tables?'
+    r'|what\s+tables?\s*(?:are there|exist|do i have)?'
+    r'|tables?'
+    r'|get\s+(?:all\s+)?tables?)$'
+)
+
+# Only one alternative's group is set on a match; it holds the table name
+_TABLE_SCHEMA_RE = re.compile(
+    r'^(?:describe\s+(\w+)'
+    r'|describe\s+(\w+)\s+table'
+    r'|show\s+(\w+)\s+schema'
+    r'|(\w+)\s+table\s+schema'
+    r'|schema\s+of\s+(\w+)'
+    r'|columns\s+in\s+(\w+)'
+    r'|inspect\s+(\w+))$'
+)
+
+# Matches anything a simple intent could handle; other messages skip the
+# complexity checks and go straight to the agent
+_ANY_INTENT_RE = re.compile(
+    "|".join(f"(?:{r.pattern})" for r in (_LIST_SCHEMAS_RE, _LIST_TABLES_RE, _TABLE_SCHEMA_RE))
+)
+
+
 class IntentDetector:
     """Detect simple user intents and execute common queries directly."""
 
@@ -43,6 +79,10 @@ class IntentDetector:
 
         text = user_input.lower().strip()
 
+        # Most messages match no simple intent at all
+        if not _ANY_INTENT_RE.match(text):
+            return None
+
         # IMPORTANT: If the query is complex, let the agent handle it
         if self._is_complex_query(text):
             return None
@@ -105,51 +145,25 @@ class IntentDetector:
         if any(word in text for word in ['where ', 'filter', 'find ', 'search ', 'get all', 'show me all']):
             return True
 
-        # Long queries are likely complex
-        word_count = len(text.split())
-        if word_count > 8:
+        # Long queries are likely complex. maxsplit stops splitting after the
+        # ninth word, so long inputs aren't split into a full word list.
+        if len(text.split(maxsplit=8)) > 8:
             return True
 
         return False
 
     def _is_simple_list_schemas(self, text: str) -> bool:
         """Check if this is a simple 'list schemas' query."""
-        simple_patterns = [
-            r'^list\s+schemas?$',
-            r'^show\s+schemas?$',
-            r'^what\s+schemas?\s*(are there|exist|do i have)?$',
-            r'^schemas?$',
-            r'^get\s+schemas?$',
-        ]
-        return any(re.match(p, text) for p in simple_patterns)
+        return _LIST_SCHEMAS_RE.match(text) is not None
 
     def _is_simple_list_tables(self, text: str) -> bool:
         """Check if this is a simple 'list tables' query."""
-        simple_patterns = [
-            r'^list\s+(all\s+)?tables?$',
-            r'^show\s+(all\s+)?tables?$',
-            r'^what\s+tables?\s*(are there|exist|do i have)?$',
-            r'^tables?$',
-            r'^get\s+(all\s+)?tables?$',
-        ]
-        return any(re.match(p, text) for p in simple_patterns)
+        return _LIST_TABLES_RE.match(text) is not None
 
     def _extract_simple_table_schema(self, text: str) -> Optional[str]:
         """Extract table name from simple schema inspection queries."""
-        simple_patterns = [
-            r'^describe\s+(\w+)$',
-            r'^describe\s+(\w+)\s+table$',
-            r'^show\s+(\w+)\s+schema$',
-            r'^(\w+)\s+table\s+schema$',
-            r'^schema\s+of\s+(\w+)$',
-            r'^columns\s+in\s+(\w+)$',
-            r'^inspect\s+(\w+)$',
-        ]
-        for p in simple_patterns:
-            match = re.match(p, text)
-            if match:
-                return match.group(1)
-        return None
+        match = _TABLE_SCHEMA_RE.match(text)
+        return match.group(match.lastindex) if match else None
 
     # --- Intent Handlers (same as before) ---
 
@@ -189,14 +203,15 @@ class IntentDetector:
 
             tables = data.get("tables", [])
             if tables:
-                table_names = [t.get('name', t) if isinstance(t, dict) else t for t in tables]
-                response += f"**Schema `{schema}`:** ({len(table_names)} tables)\n"
-                for table in table_names[:10]:
+                total = len(tables)
+                response += f"**Schema `{schema}`:** ({total} tables)\n"
+                for t in tables[:10]:
+                    table = t.get('name', t) if isinstance(t, dict) else t
                     response += f"  - `{table}`\n"
-                if len(table_names) > 10:
-                    response += f"  ... and {len(table_names) - 10} more\n"
+                if total > 10:
+                    response += f"  ... and {total - 10} more\n"
                 response += "\n"
-                total_tables += len(table_names)
+                total_tables += total
 
         if total_tables == 0:
             return "No tables found in the database."
@@ -0,0 +1,126 @@
+"""
+Response Cache for Repeated Questions
+
+Remembers the agent's final answers so that a repeated question can be
+answered without another LLM round trip.
+"""
+
+import re
+from collections import OrderedDict
+from time import monotonic
+from typing import Hashable, Optional, Tuple
+
+
+# Cached answers older than this (in seconds) are treated as missing, since
+# the data they describe may have changed
+DEFAULT_TTL = 300.0
+
+# Words and comparison operators; other punctuation is dropped
+_TOKEN_RE = re.compile(r"\w+|<>|[<>!=]=|[<>=]")
+
+# Words that never change what a question asks for
+FILLER_WORDS = frozenset({"a", "an", "the", "please", "kindly", "me", "us"})
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a question for comparison.
+
+    Args:
+        question: User's message
+
+    Returns:
+        Lowercased words and comparison operators separated by single
+        spaces, other punctuation removed
+    """
+    return " ".join(_TOKEN_RE.findall(question.lower()))
+
+
+def fingerprint(text: str) -> str:
+    """
+    Fingerprint a normalized question.
+
+    Args:
+        text: Output of normalize_question()
+
+    Returns:
+        The question's tokens in their original order with filler words
+        removed. Order is kept because it carries meaning: "price > cost"
+        is not "cost > price".
+    """
+    return " ".join(token for token in text.split() if token not in FILLER_WORDS)
+
+
+class ResponseCache:
+    """
+    LRU cache of agent answers.
+
+    Questions only match when their fingerprints are equal. There is no
+    fuzzy matching: a single changed word ("active" vs "not active",
+    "alice" vs "alicia"), operator or word order can change the answer
+    completely.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = DEFAULT_TTL):
+        """
+        Initialize ResponseCache.
+
+        Args:
+            maxsize: Maximum number of cached answers
+            ttl: Seconds before a cached answer expires
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # (scope, fingerprint) -> (stored_at, response)
+        self._entries: "OrderedDict[Tuple[Hashable, str], Tuple[float, str]]" = OrderedDict()
+
+    def get(self, question: str, scope: Hashable) -> Optional[str]:
+        """
+        Find the answer to the same question.
+
+        Args:
+            question: User's message
+            scope: Identifies the database the answer came from
+
+        Returns:
+            Cached response, or None if the question is not cached
+        """
+        text = normalize_question(question)
+        if not text:
+            return None
+
+        key = (scope, fingerprint(text))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, question: str, scope: Hashable, response: str) -> None:
+        """
+        Store the agent's answer to a question.
+
+        Args:
+            question: User's message
+            scope: Identifies the database the answer came from
+            response: Agent's final response
+        """
+        text = normalize_question(question)
+        if not text:
+            return
+
+        key = (scope, fingerprint(text))
+        self._entries[key] = (monotonic(), response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached answers."""
+        self._entries.clear()
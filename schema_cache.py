@@ -0,0 +1,140 @@
+"""
+Persistent Schema Cache
+
+Stores schema introspection results (list_tables, inspect_schema) on disk
+so a new session against the same database can skip the catalog queries.
+Only catalog metadata is stored; table rows never reach the cache file.
+
+Callers fold a catalog version (see PostgreSQLTools._catalog_version) into
+each key, so DDL from any session invalidates the affected entries at once;
+the TTL only bounds how stale row estimates can get.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Cached entries older than this (in seconds) are treated as missing
+DEFAULT_TTL = 300.0
+
+
+class SchemaCache:
+    """SQLite-backed key/value cache for schema introspection results."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        """
+        Initialize SchemaCache.
+
+        Args:
+            path: SQLite file path (default: ~/.chat2sql/schema_cache.sqlite)
+            ttl: Seconds before a cached entry expires
+        """
+        self.path = path or Path.home() / ".chat2sql" / "schema_cache.sqlite"
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Open the cache database on first use, dropping expired entries."""
+        if self._conn is None:
+            self.path.parent.mkdir(exist_ok=True, parents=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB, ts REAL)"
+            )
+            conn.execute("DELETE FROM kv WHERE ts < ?", (time.time() - self.ttl,))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from its parts.
+
+        Args:
+            parts: Values identifying the entry (host, database, schema, ...)
+
+        Returns:
+            Hex digest of the joined parts
+        """
+        raw = "\x1f".join("" if p is None else str(p) for p in parts)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        try:
+            with self._lock:
+                row = self._get_conn().execute(
+                    "SELECT value, ts FROM kv WHERE key = ?", (key,)
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a result.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable result
+        """
+        try:
+            blob = json.dumps(value)
+            with self._lock:
+                conn = self._get_conn()
+                conn.execute(
+                    "INSERT OR REPLACE INTO kv (key, value, ts) VALUES (?, ?, ?)",
+                    (key, blob, time.time())
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError, TypeError, ValueError):
+            pass
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        try:
+            with self._lock:
+                conn = self._get_conn()
+                conn.execute("DELETE FROM kv")
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+
+# Global schema cache instance
+_schema_cache_instance: Optional[SchemaCache] = None
+
+
+def get_schema_cache() -> SchemaCache:
+    """
+    Get global schema cache instance.
+
+    Returns:
+        SchemaCache instance
+    """
+    global _schema_cache_instance
+    if _schema_cache_instance is None:
+        _schema_cache_instance = SchemaCache()
+    return _schema_cache_instance
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tests for the response cache.
+
+Checks that repeated questions hit the cache and that questions whose
+meaning differs by a single word never do.
+
+Run directly or with pytest.
+"""
+
+import asyncio
+import sys
+
+from langchain_core.messages import AIMessage, HumanMessage
+from textual.app import App
+
+from agent import AgentEvent, SQLAgent
+from response_cache import ResponseCache, normalize_question
+from tools import PostgreSQLTools
+from ui import ChatView
+
+SCOPE = ("localhost", 5432, "shop", "postgres")
+
+
+def _cache_with(question: str, answer: str = "cached answer") -> ResponseCache:
+    cache = ResponseCache()
+    cache.put(question, SCOPE, answer)
+    return cache
+
+
+def test_repeated_question_hits():
+    cache = _cache_with("How many users are active?")
+    assert cache.get("how many users are active", SCOPE) == "cached answer"
+
+
+def test_filler_words_and_punctuation_are_ignored():
+    cache = _cache_with("Show me the users, please.")
+    assert cache.get("show users", SCOPE) == "cached answer"
+
+
+def test_operators_are_kept():
+    assert normalize_question("id >= 5 and id <> 7") == "id >= 5 and id <> 7"
+
+
+def test_other_database_misses():
+    cache = _cache_with("how many users are active")
+    assert cache.get("how many users are active", ("otherhost", 5432, "shop", "postgres")) is None
+
+
+def test_expired_entry_misses():
+    cache = ResponseCache(ttl=0.0)
+    cache.put("how many users are active", SCOPE, "cached answer")
+    assert cache.get("how many users are active", SCOPE) is None
+
+
+def test_changed_meaning_misses():
+    pairs = [
+        ("how many users are active", "how many users are not active"),
+        ("how many users are active", "how many users are inactive"),
+        ("list orders by date ascending", "list orders by date descending"),
+        ("show orders for alice", "show orders for alicia"),
+        ("count admins", "count not admins"),
+        ("show 5 rows from users", "show 6 rows from users"),
+        ("show users where id > 5", "show users where id < 5"),
+        ("show users where id > 5", "show users where id = 5"),
+        ("rows where price > cost", "rows where cost > price"),
+        ("orders from user to product", "orders from product to user"),
+    ]
+    for stored, asked in pairs:
+        cache = _cache_with(stored)
+        assert cache.get(asked, SCOPE) is None, f"{asked!r} was answered with {stored!r}"
+        cache = _cache_with(asked)
+        assert cache.get(stored, SCOPE) is None, f"{stored!r} was answered with {asked!r}"
+
+
+class _FakeAgent(SQLAgent):
+    """SQLAgent that answers without an LLM and records what it was asked."""
+
+    def __init__(self, db_tools: PostgreSQLTools):
+        self.db_tools = db_tools
+        self.asked = []
+
+    async def process_message_streaming(self, user_message, state=None):
+        messages = list(state["messages"]) if state else []
+        self.asked.append((user_message, len(messages)))
+        messages += [HumanMessage(content=user_message), AIMessage(content=f"answer to {user_message}")]
+        yield AgentEvent(AgentEvent.RESPONSE, {
+            "content": f"answer to {user_message}",
+            "state": {"messages": messages, "pending_approval": None, "db_connected": True}
+        })
+
+
+class _ChatApp(App):
+    def compose(self):
+        yield ChatView(PostgreSQLTools({"host": "localhost", "port": 5432, "database": "shop", "user": "postgres"}))
+
+
+async def _ask(pilot, question: str) -> None:
+    """Submit a message to the ChatView and wait for it to be handled."""
+    pilot.app.query_one(ChatView)._input.value = question
+    await pilot.press("enter")
+    await pilot.app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+def test_chat_view_uses_cache():
+    async def run():
+        app = _ChatApp()
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatView)
+            agent = chat.agent = _FakeAgent(chat.db_tools)
+
+            # A repeated opening question is answered from the cache
+            await _ask(pilot, "how many orders were placed last week")
+            await _ask(pilot, "/clear")
+            await _ask(pilot, "how many orders were placed last week")
+            assert len(agent.asked) == 1
+            assert any("Cached Response" in line.text for line in chat._messages.lines)
+
+            # The cached turn is part of the conversation, so follow-ups see it
+            await _ask(pilot, "and the week before")
+            assert agent.asked[-1] == ("and the week before", 2)
+
+            # The same follow-up after the same history is cached too
+            await _ask(pilot, "/clear")
+            await _ask(pilot, "how many orders were placed last week")
+            await _ask(pilot, "and the week before")
+            assert len(agent.asked) == 2
+
+            # After a different history the follow-up means something else
+            await _ask(pilot, "/clear")
+            await _ask(pilot, "how many refunds were issued last week")
+            await _ask(pilot, "and the week before")
+            assert len(agent.asked) == 4
+
+    asyncio.run(run())
+
+
+def test_chat_view_keeps_operator_and_order_variants_apart():
+    async def run():
+        app = _ChatApp()
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatView)
+            agent = chat.agent = _FakeAgent(chat.db_tools)
+
+            for question in (
+                "show users where id > 5",
+                "show users where id < 5",
+                "rows where price > cost",
+                "rows where cost > price",
+                "Show the users where id > 5?",
+            ):
+                await _ask(pilot, "/clear")
+                await _ask(pilot, question)
+
+            # Only the last question, a reworded repeat of the first, is cached
+            assert len(agent.asked) == 4
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    failed = 0
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            try:
+                test()
+                print(f"✅ {name}")
+            except AssertionError as e:
+                failed += 1
+                print(f"❌ {name}: {e}")
+    sys.exit(1 if failed else 0)
@@ -4,13 +4,46 @@ PostgreSQL Database Tools for SQL Agent
 This module provides tools for PostgreSQL database inspection and querying.
 """
 
+import asyncio
+import threading
 import psycopg2
 from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
 from typing import Dict, Any, Optional, List
 import json
+import re
 from datetime import datetime, date, time
 from decimal import Decimal
+from time import monotonic
+
+from schema_cache import SchemaCache, get_schema_cache
+
+
+def _serialize_bytes(obj: bytes):
+    """Decode bytea as UTF-8 text when possible, otherwise describe it."""
+    try:
+        return obj.decode('utf-8')
+    except UnicodeDecodeError:
+        return f"<binary data: {len(obj)} bytes>"
+
+
+def _serialize_memoryview(obj: memoryview):
+    return f"<binary data: {len(obj)} bytes>"
+
+
+# Types psycopg2 returns that are already JSON-safe; most cells are one of these
+_PASSTHROUGH_TYPES = frozenset({int, str, float, bool, type(None)})
+
+# Exact-type dispatch for serialize_db_value. A dict lookup on type(obj)
+# replaces a chain of isinstance checks for every cell of a result set.
+_SERIALIZERS = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    Decimal: float,
+    bytes: _serialize_bytes,
+    memoryview: _serialize_memoryview,
+}
 
 
 def serialize_db_value(obj):
@@ -20,24 +53,26 @@ def serialize_db_value(obj):
     Handles:
     - datetime, date, time -> ISO format strings
     - Decimal -> float
-    - bytes/bytea -> base64 string (for display)
-    - memoryview -> base64 string
+    - bytes/bytea -> UTF-8 text, or a size description for binary data
+    - memoryview -> size description
     """
+    obj_type = type(obj)
+    if obj_type in _PASSTHROUGH_TYPES:
+        return obj
+
+    handler = _SERIALIZERS.get(obj_type)
+    if handler is not None:
+        return handler(obj)
+
+    # Subclasses of the supported types fall back to isinstance checks
     if isinstance(obj, (datetime, date, time)):
         return obj.isoformat()
     elif isinstance(obj, Decimal):
         return float(obj)
     elif isinstance(obj, bytes):
-        # For bytea data, return a readable representation
-        try:
-            # Try to decode as UTF-8 text
-            return obj.decode('utf-8')
-        except UnicodeDecodeError:
-            # If binary data, return base64 for display
-            import base64
-            return f"<binary data: {len(obj)} bytes>"
+        return _serialize_bytes(obj)
     elif isinstance(obj, memoryview):
-        return f"<binary data: {len(obj)} bytes>"
+        return _serialize_memoryview(obj)
     return obj
 
 
@@ -48,18 +83,71 @@ def serialize_db_row(row):
     return row
 
 
+# Case-insensitive SQL checks for validate_sql/execute_query. Matching with
+# compiled patterns avoids upper-casing a copy of every query.
+_FORBIDDEN_RE = re.compile(
+    r"DELETE|DROP|TRUNCATE|UPDATE|INSERT|ALTER|CREATE|GRANT|REVOKE",
+    re.IGNORECASE
+)
+_SELECT_RE = re.compile(r"\s*SELECT", re.IGNORECASE)
+_LIMIT_RE = re.compile(r"LIMIT", re.IGNORECASE)
+
+
+class _ResultCache:
+    """Bounded FIFO cache with a TTL for per-connection tool results."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """Get a cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            return value
+
+    def put(self, key: Any, value: Dict[str, Any]) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (monotonic(), value)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._data.clear()
+
+
 class PostgreSQLTools:
     """Collection of PostgreSQL database interaction tools for the AI agent."""
 
-    def __init__(self, connection_params: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        connection_params: Optional[Dict[str, str]] = None,
+        schema_cache: Optional[SchemaCache] = None
+    ):
         """
         Initialize PostgreSQLTools.
 
         Args:
             connection_params: Dict with keys: host, port, database, user, password
+            schema_cache: On-disk cache for introspection results (default: global cache)
         """
         self.connection_params = connection_params
         self._connection = None
+        self.schema_cache = schema_cache or get_schema_cache()
+        self._server_version: Optional[str] = None
+        self._validate_cache = _ResultCache()
+        self._relationships_cache = _ResultCache()
 
     def test_connection(self) -> Dict[str, Any]:
         """
@@ -82,6 +170,8 @@ class PostgreSQLTools:
             cursor.close()
             conn.close()
 
+            self._server_version = version
+
             return {
                 "success": True,
                 "message": "Connection successful",
@@ -116,9 +206,23 @@ class PostgreSQLTools:
             "user": user,
             "password": password
         }
+        self._validate_cache.clear()
+        self._relationships_cache.clear()
 
         return self.test_connection()
 
+    def use_connection(self, other: "PostgreSQLTools") -> None:
+        """
+        Switch to the connection another instance has already verified.
+
+        Args:
+            other: Instance whose connect() succeeded
+        """
+        self.connection_params = other.connection_params
+        self._server_version = other._server_version
+        self._validate_cache.clear()
+        self._relationships_cache.clear()
+
     def _get_connection(self):
         """Get database connection."""
         if not self.connection_params:
@@ -126,6 +230,55 @@ class PostgreSQLTools:
 
         return psycopg2.connect(**self.connection_params)
 
+    def _schema_cache_key(self, kind: str, schema: str, catalog_version: str, table: str = "") -> str:
+        """Build the schema cache key for the current connection."""
+        params = self.connection_params or {}
+        return self.schema_cache.make_key(
+            kind,
+            params.get("host"),
+            params.get("port"),
+            params.get("database"),
+            params.get("user"),
+            self._server_version,
+            schema,
+            catalog_version,
+            table
+        )
+
+    @staticmethod
+    def _catalog_version(cursor, schema: str) -> str:
+        """
+        Get a marker that changes whenever DDL touches the schema.
+
+        Creating, altering or dropping a table, column, index or constraint
+        adds, removes or rewrites a pg_class, pg_attribute or pg_constraint
+        row, which changes the row count or the newest xmin. Folding this
+        into the schema cache key makes such entries miss immediately
+        instead of surviving until the TTL.
+        """
+        cursor.execute("""
+            SELECT COUNT(*) as entries, MAX(x::text::bigint) as newest
+            FROM (
+                SELECT c.xmin AS x
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s
+                UNION ALL
+                SELECT a.xmin
+                FROM pg_attribute a
+                JOIN pg_class c ON c.oid = a.attrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s
+                UNION ALL
+                SELECT k.xmin
+                FROM pg_constraint k
+                JOIN pg_namespace n ON n.oid = k.connamespace
+                WHERE n.nspname = %s
+            ) catalog_rows
+        """, [schema, schema, schema])
+        row = cursor.fetchone()
+        return f"{row['entries']}:{row['newest']}"
+
     def list_schemas(self) -> Dict[str, Any]:
         """
         List all schemas in the database.
@@ -174,41 +327,83 @@ class PostgreSQLTools:
             conn = self._get_connection()
             cursor = conn.cursor(cursor_factory=RealDictCursor)
 
-            # Get tables with row counts
-            cursor.execute(sql.SQL("""
+            catalog_version = self._catalog_version(cursor, schema)
+            cache_key = self._schema_cache_key("list_tables", schema, catalog_version)
+            cached = self.schema_cache.get(cache_key)
+            if cached is not None:
+                cursor.close()
+                conn.close()
+                return cached
+
+            # Get tables with planner row estimates. reltuples is maintained by
+            # ANALYZE/VACUUM, so no per-table COUNT(*) scan is needed.
+            # Partitioned parents hold no rows of their own (and are not
+            # analyzed automatically), so theirs is the sum over their leaf
+            # partitions.
+            cursor.execute("""
                 SELECT
-                    t.table_name,
-                    pg_total_relation_size(quote_ident(t.table_schema) || '.' || quote_ident(t.table_name)) as size_bytes,
+                    c.relname as table_name,
+                    c.relkind as relkind,
+                    pg_total_relation_size(c.oid) as size_bytes,
+                    CASE WHEN c.relkind = 'p' THEN (
+                        WITH RECURSIVE parts(oid) AS (
+                            SELECT i.inhrelid FROM pg_inherits i WHERE i.inhparent = c.oid
+                            UNION ALL
+                            SELECT i.inhrelid FROM pg_inherits i JOIN parts ON i.inhparent = parts.oid
+                        )
+                        SELECT COALESCE(SUM(GREATEST(pc.reltuples, 0)), 0)::bigint
+                        FROM parts
+                        JOIN pg_class pc ON pc.oid = parts.oid
+                        WHERE pc.relkind <> 'p'
+                    ) ELSE c.reltuples::bigint END as estimated_rows,
+                    c.relpages as relpages,
                     (SELECT COUNT(*)
-                     FROM information_schema.columns c
-                     WHERE c.table_schema = t.table_schema
-                     AND c.table_name = t.table_name) as column_count
-                FROM information_schema.tables t
-                WHERE t.table_schema = %s
-                AND t.table_type = 'BASE TABLE'
-                ORDER BY t.table_name
-            """), [schema])
+                     FROM pg_attribute a
+                     WHERE a.attrelid = c.oid
+                     AND a.attnum > 0
+                     AND NOT a.attisdropped) as column_count
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s
+                AND c.relkind IN ('r', 'p')
+                AND (pg_has_role(c.relowner, 'USAGE')
+                     OR has_table_privilege(c.oid, 'SELECT, INSERT, UPDATE, DELETE, TRUNCATE, REFERENCES, TRIGGER')
+                     OR has_any_column_privilege(c.oid, 'SELECT, INSERT, UPDATE, REFERENCES'))
+                ORDER BY c.relname
+            """, [schema])
 
             tables = cursor.fetchall()
 
-            # Get row counts for each table
             table_list = []
             for table in tables:
-                try:
-                    cursor.execute(
-                        sql.SQL("SELECT COUNT(*) as row_count FROM {schema}.{table}").format(
-                            schema=sql.Identifier(schema),
-                            table=sql.Identifier(table["table_name"])
+                row_count = table["estimated_rows"]
+                is_estimate = True
+
+                # Never analyzed (reltuples = -1, or 0 with no pages before
+                # PostgreSQL 14): count this table exactly. Partitioned
+                # parents always have relpages = 0, so they keep the estimate
+                # summed from their partitions instead of scanning them all.
+                if table["relkind"] != "p" and (
+                    row_count < 0 or (row_count == 0 and table["relpages"] == 0)
+                ):
+                    is_estimate = False
+                    try:
+                        cursor.execute(
+                            sql.SQL("SELECT COUNT(*) as row_count FROM {schema}.{table}").format(
+                                schema=sql.Identifier(schema),
+                                table=sql.Identifier(table["table_name"])
+                            )
                         )
-                    )
-                    row_count = cursor.fetchone()["row_count"]
-                except:
-                    row_count = 0
+                        row_count = cursor.fetchone()["row_count"]
+                    except psycopg2.Error:
+                        conn.rollback()
+                        row_count = 0
 
                 table_list.append({
                     "name": table["table_name"],
                     "schema": schema,
                     "row_count": row_count,
+                    "row_count_is_estimate": is_estimate,
                     "column_count": table["column_count"],
                     "size_bytes": table["size_bytes"]
                 })
@@ -216,12 +411,14 @@ class PostgreSQLTools:
             cursor.close()
             conn.close()
 
-            return {
+            result = {
                 "success": True,
                 "schema": schema,
                 "tables": table_list,
                 "count": len(table_list)
             }
+            self.schema_cache.set(cache_key, result)
+            return result
         except Exception as e:
             return {
                 "success": False,
@@ -244,6 +441,16 @@ class PostgreSQLTools:
             conn = self._get_connection()
             cursor = conn.cursor(cursor_factory=RealDictCursor)
 
+            catalog_version = self._catalog_version(cursor, schema)
+            cache_key = self._schema_cache_key("inspect_schema", schema, catalog_version, table_name)
+            cached = self.schema_cache.get(cache_key)
+            if cached is not None:
+                # Only catalog metadata is cached; sample rows are fetched live
+                sample_data = self._fetch_sample_data(cursor, schema, table_name)
+                cursor.close()
+                conn.close()
+                return {**cached, "sample_data": sample_data}
+
             # Get columns
             cursor.execute("""
                 SELECT
@@ -319,22 +526,12 @@ class PostgreSQLTools:
 
             indexes = cursor.fetchall()
 
-            # Get sample data (3 rows)
-            cursor.execute(
-                sql.SQL("SELECT * FROM {schema}.{table} LIMIT 3").format(
-                    schema=sql.Identifier(schema),
-                    table=sql.Identifier(table_name)
-                )
-            )
-            sample_data = cursor.fetchall()
+            sample_data = self._fetch_sample_data(cursor, schema, table_name)
 
             cursor.close()
             conn.close()
 
-            # Serialize sample data to handle datetime, bytea, etc.
-            serialized_sample_data = [serialize_db_row(row) for row in sample_data]
-
-            return {
+            result = {
                 "success": True,
                 "table": table_name,
                 "schema": schema,
@@ -368,8 +565,10 @@ class PostgreSQLTools:
                     }
                     for idx in indexes
                 ],
-                "sample_data": serialized_sample_data
             }
+            # Sample rows are table data, so they are never written to disk
+            self.schema_cache.set(cache_key, result)
+            return {**result, "sample_data": sample_data}
 
         except Exception as e:
             return {
@@ -378,34 +577,55 @@ class PostgreSQLTools:
                 "error_type": "database_error"
             }
 
+    @staticmethod
+    def _fetch_sample_data(cursor, schema: str, table_name: str) -> List[Dict[str, Any]]:
+        """Get 3 sample rows, serialized to handle datetime, bytea, etc."""
+        cursor.execute(
+            sql.SQL("SELECT * FROM {schema}.{table} LIMIT 3").format(
+                schema=sql.Identifier(schema),
+                table=sql.Identifier(table_name)
+            )
+        )
+        return [serialize_db_row(row) for row in cursor.fetchall()]
+
     def validate_sql(self, sql_query: str) -> Dict[str, Any]:
         """
         Validate SQL query for safety and syntax.
 
+        Results are memoized per connection, so re-validating the same
+        query (e.g. validate_sql followed by execute_query) skips EXPLAIN.
+
         Args:
             sql_query: SQL query to validate
 
         Returns:
             Dict with validation results
         """
+        cached = self._validate_cache.get(sql_query)
+        if cached is not None:
+            return cached
+
+        result = self._validate_sql(sql_query)
+
+        # A syntax_error may also be a dropped connection, so don't cache it
+        if result.get("error_type") != "syntax_error":
+            self._validate_cache.put(sql_query, result)
+        return result
+
+    def _validate_sql(self, sql_query: str) -> Dict[str, Any]:
+        """Run the validation checks for validate_sql()."""
         # Safety checks
-        forbidden_keywords = [
-            'DELETE', 'DROP', 'TRUNCATE', 'UPDATE', 'INSERT',
-            'ALTER', 'CREATE', 'GRANT', 'REVOKE'
-        ]
-        query_upper = sql_query.upper()
-
-        for keyword in forbidden_keywords:
-            if keyword in query_upper:
-                return {
-                    "success": False,
-                    "valid": False,
-                    "error": f"Forbidden operation: {keyword}",
-                    "error_type": "permission_denied"
-                }
+        forbidden = _FORBIDDEN_RE.search(sql_query)
+        if forbidden:
+            return {
+                "success": False,
+                "valid": False,
+                "error": f"Forbidden operation: {forbidden.group(0).upper()}",
+                "error_type": "permission_denied"
+            }
 
         # Check if it's a SELECT query
-        if not query_upper.strip().startswith('SELECT'):
+        if not _SELECT_RE.match(sql_query):
             return {
                 "success": False,
                 "valid": False,
@@ -414,7 +634,7 @@ class PostgreSQLTools:
             }
 
         # Check for LIMIT clause
-        if 'LIMIT' not in query_upper:
+        if not _LIMIT_RE.search(sql_query):
             return {
                 "success": True,
                 "valid": True,
@@ -463,12 +683,13 @@ class PostgreSQLTools:
 
         try:
             # Add LIMIT if not present
-            query_upper = sql_query.upper()
-            if 'LIMIT' not in query_upper:
+            if not _LIMIT_RE.search(sql_query):
                 sql_query = f"{sql_query.rstrip(';')} LIMIT {limit}"
 
             conn = self._get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            # Plain tuple cursor: rows are returned positionally alongside a
+            # single column-name list, avoiding a dict per row
+            cursor = conn.cursor()
 
             # Execute query with timeout (30 seconds)
             cursor.execute("SET statement_timeout = 30000")
@@ -481,7 +702,7 @@ class PostgreSQLTools:
             conn.close()
 
             # Serialize rows to handle datetime, bytea, and other non-JSON types
-            serialized_rows = [serialize_db_row(row) for row in rows]
+            serialized_rows = [[serialize_db_value(value) for value in row] for row in rows]
 
             return {
                 "success": True,
@@ -509,6 +730,8 @@ class PostgreSQLTools:
         """
         Get all relationships for a table (foreign keys in and out).
 
+        Successful results are memoized per connection.
+
         Args:
             table_name: Table name
             schema: Schema name
@@ -516,6 +739,11 @@ class PostgreSQLTools:
         Returns:
             Dict with relationship information
         """
+        cache_key = (schema, table_name)
+        cached = self._relationships_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             conn = self._get_connection()
             cursor = conn.cursor(cursor_factory=RealDictCursor)
@@ -565,13 +793,15 @@ class PostgreSQLTools:
             cursor.close()
             conn.close()
 
-            return {
+            result = {
                 "success": True,
                 "table": table_name,
                 "schema": schema,
                 "outgoing_relationships": outgoing_fks,
                 "incoming_relationships": incoming_fks
             }
+            self._relationships_cache.put(cache_key, result)
+            return result
 
         except Exception as e:
             return {
@@ -580,6 +810,41 @@ class PostgreSQLTools:
                 "error_type": "database_error"
             }
 
+    # Async variants - run the blocking psycopg2 calls in a worker thread
+    # so they don't stall the event loop (Textual UI, agent loop).
+
+    async def test_connection_async(self) -> Dict[str, Any]:
+        """Async version of test_connection()."""
+        return await asyncio.to_thread(self.test_connection)
+
+    async def connect_async(self, host: str, port: int, database: str, user: str, password: str) -> Dict[str, Any]:
+        """Async version of connect()."""
+        return await asyncio.to_thread(self.connect, host, port, database, user, password)
+
+    async def list_schemas_async(self) -> Dict[str, Any]:
+        """Async version of list_schemas()."""
+        return await asyncio.to_thread(self.list_schemas)
+
+    async def list_tables_async(self, schema: str = "public") -> Dict[str, Any]:
+        """Async version of list_tables()."""
+        return await asyncio.to_thread(self.list_tables, schema)
+
+    async def inspect_schema_async(self, table_name: str, schema: str = "public") -> Dict[str, Any]:
+        """Async version of inspect_schema()."""
+        return await asyncio.to_thread(self.inspect_schema, table_name, schema)
+
+    async def validate_sql_async(self, sql_query: str) -> Dict[str, Any]:
+        """Async version of validate_sql()."""
+        return await asyncio.to_thread(self.validate_sql, sql_query)
+
+    async def execute_query_async(self, sql_query: str, limit: int = 100) -> Dict[str, Any]:
+        """Async version of execute_query()."""
+        return await asyncio.to_thread(self.execute_query, sql_query, limit)
+
+    async def get_table_relationships_async(self, table_name: str, schema: str = "public") -> Dict[str, Any]:
+        """Async version of get_table_relationships()."""
+        return await asyncio.to_thread(self.get_table_relationships, table_name, schema)
+
 
 # LangChain Tool Wrappers
 def create_langchain_tools(db_tools: PostgreSQLTools):
@@ -644,39 +909,70 @@ def create_langchain_tools(db_tools: PostgreSQLTools):
         """Execute SQL query."""
         return json.dumps(db_tools.execute_query(sql))
 
+    # Async tool functions (used by ainvoke / the agent loop)
+    async def _list_schemas_coro() -> str:
+        """List all database schemas."""
+        return json.dumps(await db_tools.list_schemas_async())
+
+    async def _list_tables_coro(schema_name: str = "public") -> str:
+        """List tables in a schema."""
+        return json.dumps(await db_tools.list_tables_async(schema=schema_name))
+
+    async def _inspect_schema_coro(table_name: str, schema_name: str = "public") -> str:
+        """Inspect a table schema."""
+        return json.dumps(await db_tools.inspect_schema_async(table_name, schema=schema_name))
+
+    async def _get_relationships_coro(table_name: str, schema_name: str = "public") -> str:
+        """Get table relationships."""
+        return json.dumps(await db_tools.get_table_relationships_async(table_name, schema=schema_name))
+
+    async def _validate_sql_coro(sql: str) -> str:
+        """Validate SQL query."""
+        return json.dumps(await db_tools.validate_sql_async(sql))
+
+    async def _execute_query_coro(sql: str) -> str:
+        """Execute SQL query."""
+        return json.dumps(await db_tools.execute_query_async(sql))
+
     # Create tools with proper schemas
     tools = [
         StructuredTool.from_function(
             func=_list_schemas_func,
+            coroutine=_list_schemas_coro,
             name="list_schemas",
             description="List all schemas in the PostgreSQL database. Returns: JSON with list of schema names."
         ),
         StructuredTool.from_function(
             func=_list_tables_func,
+            coroutine=_list_tables_coro,
             name="list_tables",
             description="List all tables in a schema. Input: schema_name (default: 'public'). Returns: JSON with list of tables.",
             args_schema=ListTablesInput
         ),
         StructuredTool.from_function(
             func=_inspect_schema_func,
+            coroutine=_inspect_schema_coro,
             name="inspect_schema",
             description="Get detailed schema information for a table. Input: table_name (required), schema_name (default: 'public'). Returns: JSON with columns, types, constraints, indexes.",
             args_schema=InspectSchemaInput
         ),
         StructuredTool.from_function(
             func=_get_relationships_func,
+            coroutine=_get_relationships_coro,
             name="get_table_relationships",
             description="Get all foreign key relationships for a table. Input: table_name (required), schema_name (default: 'public'). Returns: JSON with relationships.",
             args_schema=GetRelationshipsInput
         ),
         StructuredTool.from_function(
             func=_validate_sql_func,
+            coroutine=_validate_sql_coro,
             name="validate_sql",
             description="Validate SQL query for safety and syntax. Input: sql (required). Returns: JSON with validation results.",
             args_schema=ValidateSQLInput
         ),
         StructuredTool.from_function(
             func=_execute_query_func,
+            coroutine=_execute_query_coro,
             name="execute_query",
             description="Execute a SELECT SQL query. IMPORTANT: Requires user approval. Input: sql (required). Returns: JSON with query results.",
             args_schema=ExecuteQueryInput
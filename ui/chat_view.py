@@ -1,19 +1,192 @@
 """Main chat view for SQL Agent TUI with ReAct pattern."""
 
-from textual.widgets import Input, RichLog, Label
+from textual.widgets import Input, Label
 from textual.containers import Container, Horizontal
 from textual.app import ComposeResult
 from textual.widget import Widget
-from typing import Optional, Dict
-import json
+from typing import Optional, Dict, List, Sequence, Tuple, AsyncIterator
+from collections import OrderedDict
+import asyncio
+import hashlib
+import re
+import reprlib
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    import json as _json
 
 from agent import SQLAgent, AgentEvent
 from tools import PostgreSQLTools
 from intent_detector import IntentDetector
-from .modals import DatabaseConfigModal, ModelsConfigModal, QueryApprovalModal
+from response_cache import ResponseCache
+from .message_log import MessageLog
+from .modals import DatabaseConfigModal, ModelsConfigModal, QueryApprovalModal, highlight_sql
 from .styles import CHAT_VIEW_STYLES
 
 
+# Scrollback kept by the message log; older lines are dropped by RichLog
+MAX_LOG_LINES = 2000
+TRUNCATION_MARKER = "[dim]— earlier output truncated —[/dim]"
+
+# Markup templates for the high-frequency agent events
+_THINKING_STEP_FMT = "[dim]🤔 Thinking (step %d)...[/dim]"
+_TOOL_CALL_FMT = "[bold magenta]🔧 Calling:[/bold magenta] [cyan]%s[/cyan](%s)"
+_TOOL_RESULT_FMT = "[dim]   ↳ %s[/dim]"
+
+# Tool results longer than this are previewed as text rather than decoded
+_MAX_PARSE_CHARS = 64 * 1024
+
+# Tool results are only decoded when their first non-blank character opens
+# a JSON object or array
+_JSON_START_RE = re.compile(r"\s*[{\[]")
+
+# Number of formatted tool-result previews kept per chat view
+_PREVIEW_CACHE_SIZE = 128
+
+# Agent events arriving within this window (seconds, about one frame) are
+# rendered together, up to _EVENT_BATCH_SIZE events per log write
+_EVENT_BATCH_WINDOW = 0.016
+_EVENT_BATCH_SIZE = 8
+
+# Queue sentinel marking the end of an agent event stream
+_STREAM_END = object()
+
+# Static blocks, each written to the log with a single call
+_BANNER = "\n".join([
+    "[bold cyan]🤖 SQL Agent TUI[/bold cyan]\n",
+    "[dim]Welcome! Use slash commands to get started:[/dim]",
+    "[dim]  /models - Configure LLM provider and API key[/dim]",
+    "[dim]  /db - Connect to PostgreSQL database[/dim]",
+    "[dim]  /help - Show all commands[/dim]",
+    "",
+    "[bold yellow]💡 How to copy text:[/bold yellow]",
+    "[dim]  Linux/Windows: Hold SHIFT while selecting, then CTRL+SHIFT+C[/dim]",
+    "[dim]  Mac: Hold OPTION while selecting, then CMD+C[/dim]\n",
+])
+
+_HELP_TEXT = "\n".join([
+    "\n[bold]Available Commands:[/bold]",
+    "  [cyan]/models[/cyan] - Configure LLM provider",
+    "  [cyan]/db[/cyan] - Connect to PostgreSQL database",
+    "  [cyan]/status[/cyan] - Show current status",
+    "  [cyan]/clear[/cyan] - Clear chat history",
+    "  [cyan]/help[/cyan] - Show this help",
+    "\n[bold]How It Works:[/bold]",
+    "  The agent thinks step-by-step and uses tools dynamically.",
+    "  It will explore the database, run queries, and adapt based on results.",
+    "  SQL queries require your approval before execution.",
+    "\n[bold]Example Queries:[/bold]",
+    "  - What tables are in the database?",
+    "  - How many users are there?",
+    "  - Show me 5 messages from the messages table",
+    "  - What are the relationships between tables?",
+])
+
+# Longest text written to the log for a single SQL query, response or error
+_MAX_DISPLAY_CHARS = 4000
+
+# Bounded repr() for tool-call arguments: large strings, lists and dicts are
+# elided while being formatted instead of being fully repr()'d and then cut
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxstring = 30
+_ARG_REPR.maxother = 30
+_ARG_REPR.maxlist = 3
+_ARG_REPR.maxdict = 3
+
+# Bounded repr() for result cells in the execute_query preview
+_CELL_REPR = reprlib.Repr()
+_CELL_REPR.maxstring = 20
+_CELL_REPR.maxother = 20
+
+
+def _truncate(text, limit: int = _MAX_DISPLAY_CHARS) -> str:
+    """Cut text down to limit characters, marking that it was cut."""
+    text = str(text)
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "\n[dim]… (truncated)[/dim]"
+
+
+def _truncate_row(row, columns: Sequence[str] = (), limit: int = 80) -> str:
+    """
+    Preview a result row as {column: value, ...} in at most limit characters.
+
+    Cells are formatted one at a time with bounded reprs, stopping once the
+    limit is reached, so wide rows and huge values are never fully rendered.
+    """
+    if isinstance(row, dict):
+        cells = row.items()
+    else:
+        cells = zip(columns, row) if columns else enumerate(row)
+
+    parts = []
+    total = 0
+    for name, value in cells:
+        part = f"{name!r}: {_CELL_REPR.repr(value)}"
+        parts.append(part)
+        total += len(part) + 2
+        if total >= limit:
+            break
+
+    preview = "{" + ", ".join(parts) + "}"
+    return preview[:limit] + "..." if len(preview) > limit else preview
+
+
+def _preview_list_schemas(result: dict) -> str:
+    """Count the schemas and name the first five."""
+    schemas = result.get("schemas", [])
+    return f"Found {len(schemas)} schemas: {', '.join(schemas[:5])}"
+
+
+def _preview_list_tables(result: dict) -> str:
+    """Count the tables and name the first five."""
+    tables = result.get("tables", [])
+    total = len(tables)
+    names = [t.get("name", t) if isinstance(t, dict) else t for t in tables[:5]]
+    more = f"... (+{total - 5} more)" if total > 5 else ""
+    return f"Found {total} tables: {', '.join(names)}{more}"
+
+
+def _preview_inspect_schema(result: dict) -> str:
+    """Count the columns and name the first three."""
+    columns = result.get("columns", [])
+    col_names = [c.get("name", c) if isinstance(c, dict) else c for c in columns[:3]]
+    return f"Found {len(columns)} columns: {', '.join(col_names)}..."
+
+
+def _preview_relationships(result: dict) -> str:
+    """Count foreign keys and incoming references."""
+    fks = result.get("foreign_keys", [])
+    refs = result.get("referenced_by", [])
+    return f"Found {len(fks)} foreign keys, {len(refs)} references"
+
+
+def _preview_validate_sql(result: dict) -> str:
+    """Report whether the SQL validated."""
+    return "✓ SQL is valid" if result.get("valid") else f"❌ {result.get('error', 'Invalid')}"
+
+
+def _preview_execute_query(result: dict) -> str:
+    """Count the rows and show the start of the first one."""
+    rows = result.get("data", [])
+    if rows:
+        preview = _truncate_row(rows[0], result.get("columns", []))
+        return f"Query returned {len(rows)} rows. First: {preview}"
+    return f"Query returned {len(rows)} rows"
+
+
+# Tool name -> one-line preview of its decoded (dict) result
+_TOOL_PREVIEWS = {
+    "list_schemas": _preview_list_schemas,
+    "list_tables": _preview_list_tables,
+    "inspect_schema": _preview_inspect_schema,
+    "get_table_relationships": _preview_relationships,
+    "validate_sql": _preview_validate_sql,
+    "execute_query": _preview_execute_query,
+}
+
+
 class ChatView(Widget):
     """Main chat interface with ReAct agent support."""
 
@@ -26,6 +199,31 @@ class ChatView(Widget):
         self.agent_state: Optional[Dict] = None
         self.config: Optional[Dict[str, str]] = None
         self.intent_detector = IntentDetector(db_tools)
+        self.response_cache = ResponseCache()
+        # (question, cache scope) the agent is currently answering; its RESPONSE is cached
+        self._pending_question: Optional[Tuple[str, tuple]] = None
+        # While set, _write collects text here instead of writing to the log
+        self._write_buffer: Optional[List[str]] = None
+        self._preview_cache: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+        self._status_cache: Optional[Tuple[tuple, str]] = None
+
+        # Widget references, resolved once in on_mount
+        self._messages: Optional[MessageLog] = None
+        self._input: Optional[Input] = None
+        self._provider_label: Optional[Label] = None
+        self._model_label: Optional[Label] = None
+        self._db_label: Optional[Label] = None
+
+        # Agent event type -> handler, built once instead of an if/elif chain.
+        # APPROVAL_NEEDED is handled by _handle_event_batch, which needs the
+        # continuation stream _on_approval_needed returns.
+        self._event_handlers = {
+            AgentEvent.THINKING: self._on_thinking,
+            AgentEvent.TOOL_CALL: self._on_tool_call,
+            AgentEvent.TOOL_RESULT: self._on_tool_result,
+            AgentEvent.RESPONSE: self._on_response,
+            AgentEvent.ERROR: self._on_error,
+        }
 
     def compose(self) -> ComposeResult:
         with Container(id="status-bar"):
@@ -35,13 +233,14 @@ class ChatView(Widget):
                 yield Label("DB: Not connected", id="db-status", classes="status-label")
 
         with Container(id="chat-container"):
-            rich_log = RichLog(
+            rich_log = MessageLog(
                 id="messages",
                 highlight=True,
                 markup=True,
                 wrap=True,
                 auto_scroll=True,
-                max_lines=10000
+                max_lines=MAX_LOG_LINES,
+                trim_marker=TRUNCATION_MARKER
             )
             rich_log.can_focus = False
             yield rich_log
@@ -54,21 +253,16 @@ class ChatView(Widget):
 
     def on_mount(self) -> None:
         """Initialize chat and focus input."""
-        messages = self.query_one("#messages", RichLog)
-        messages.write("[bold cyan]🤖 SQL Agent TUI[/bold cyan]\n")
-        messages.write("[dim]Welcome! Use slash commands to get started:[/dim]")
-        messages.write("[dim]  /models - Configure LLM provider and API key[/dim]")
-        messages.write("[dim]  /db - Connect to PostgreSQL database[/dim]")
-        messages.write("[dim]  /help - Show all commands[/dim]")
-        messages.write("")
-        messages.write("[bold yellow]💡 How to copy text:[/bold yellow]")
-        messages.write("[dim]  Linux/Windows: Hold SHIFT while selecting, then CTRL+SHIFT+C[/dim]")
-        messages.write("[dim]  Mac: Hold OPTION while selecting, then CMD+C[/dim]\n")
-
-        input_widget = self.query_one("#user-input", Input)
-        input_widget.can_focus = True
-        self.set_timer(0.05, lambda: input_widget.focus())
-        self.set_timer(0.2, lambda: input_widget.focus())
+        self._messages = self.query_one("#messages", MessageLog)
+        self._input = self.query_one("#user-input", Input)
+        self._provider_label = self.query_one("#provider-status", Label)
+        self._model_label = self.query_one("#model-status", Label)
+        self._db_label = self.query_one("#db-status", Label)
+
+        self._write(_BANNER)
+
+        self._input.can_focus = True
+        self.call_after_refresh(self._input.focus)
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle user input."""
@@ -77,8 +271,7 @@ class ChatView(Widget):
             return
 
         event.input.value = ""
-        messages = self.query_one("#messages", RichLog)
-        messages.write(f"\n[bold green]You:[/bold green] {user_input}")
+        self._write(f"\n[bold green]You:[/bold green] {user_input}")
 
         if user_input.startswith("/"):
             self.run_worker(
@@ -89,17 +282,25 @@ class ChatView(Widget):
             return
 
         if not self.agent:
-            messages.write("[bold red]Error:[/bold red] Please configure LLM provider first using /models")
+            self._write("[bold red]Error:[/bold red] Please configure LLM provider first using /models")
             return
 
         if not self.db_tools.connection_params:
-            messages.write("[bold yellow]Warning:[/bold yellow] No database connected. Use /db to connect.")
+            self._write("[bold yellow]Warning:[/bold yellow] No database connected. Use /db to connect.")
             return
 
         # Try intent detection for simple queries
-        intent_response = self.intent_detector.process_message(user_input)
+        intent_response = await asyncio.to_thread(self.intent_detector.process_message, user_input)
         if intent_response:
-            messages.write(f"\n[bold cyan]⚡ Quick Response:[/bold cyan]\n{intent_response}")
+            self._write(f"\n[bold cyan]⚡ Quick Response:[/bold cyan]\n{intent_response}")
+            return
+
+        # Reuse the answer to a question repeated at the same point of a
+        # conversation (the scope covers the conversation so far)
+        cached = self.response_cache.get(user_input, self._cache_scope())
+        if cached:
+            self._write(f"\n[bold cyan]⚡ Cached Response:[/bold cyan]\n{_truncate(cached)}")
+            self.agent_state = self.agent.record_exchange(user_input, cached, self.agent_state)
             return
 
         # Use full agent with ReAct pattern
@@ -111,122 +312,245 @@ class ChatView(Widget):
 
     async def _process_agent_streaming(self, user_input: str) -> None:
         """Process with ReAct pattern - continuous reasoning and tool usage."""
-        messages = self.query_one("#messages", RichLog)
-        messages.write("\n[dim]🤔 Thinking...[/dim]")
+        self._write("\n[dim]🤔 Thinking...[/dim]")
+        self._pending_question = (user_input, self._cache_scope())
+
+        # The initial stream and each post-approval continuation all feed
+        # one queue, so approvals don't nest event handling
+        queue: asyncio.Queue = asyncio.Queue()
+        producers = [asyncio.create_task(self._pump_events(
+            self.agent.process_message_streaming(user_input, self.agent_state),
+            queue
+        ))]
 
         try:
-            async for event in self.agent.process_message_streaming(user_input, self.agent_state):
-                await self._handle_agent_event(event, messages)
+            open_streams = 1
+            while open_streams:
+                batch = await self._next_event_batch(queue)
+                if batch[-1] is _STREAM_END:
+                    batch.pop()
+                    open_streams -= 1
+
+                continuation = await self._handle_event_batch(batch)
+                if continuation is not None:
+                    producers.append(asyncio.create_task(self._pump_events(continuation, queue)))
+                    open_streams += 1
 
         except Exception as e:
-            messages.write(f"\n[bold red]Error:[/bold red] {str(e)}")
+            self._write(f"\n[bold red]Error:[/bold red] {_truncate(str(e))}")
 
         finally:
-            self.query_one("#user-input", Input).focus()
-
-    async def _handle_agent_event(self, event: AgentEvent, messages: RichLog) -> None:
-        """Handle a single agent event."""
+            for producer in producers:
+                producer.cancel()
+            self._pending_question = None
+            self._input.focus()
+
+    @staticmethod
+    async def _pump_events(stream: AsyncIterator[AgentEvent], queue: asyncio.Queue) -> None:
+        """Feed agent events into the queue; stream errors are queued too."""
+        try:
+            async for event in stream:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            await queue.put(_STREAM_END)
+
+    @staticmethod
+    async def _next_event_batch(queue: asyncio.Queue) -> list:
+        """Wait for an event, then collect any that follow within the batch window."""
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _EVENT_BATCH_WINDOW
+
+        while len(batch) < _EVENT_BATCH_SIZE and batch[-1] is not _STREAM_END:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _handle_event_batch(self, events: list) -> Optional[AsyncIterator[AgentEvent]]:
+        """
+        Render a batch of agent events under a single screen update.
+
+        Returns:
+            The agent's post-approval event stream if the batch asked for
+            approval, None otherwise
+        """
+        pending: List[AgentEvent] = []
+        continuation = None
+
+        for event in events:
+            if isinstance(event, Exception):
+                await self._render_events(pending)
+                raise event
+            if event.type == AgentEvent.APPROVAL_NEEDED:
+                # The approval modal must render, so handle it outside the batch
+                await self._render_events(pending)
+                pending = []
+                continuation = await self._on_approval_needed(event)
+            else:
+                pending.append(event)
 
-        if event.type == AgentEvent.THINKING:
-            iteration = event.data.get("iteration", 1)
-            if iteration > 1:
-                messages.write(f"[dim]🤔 Thinking (step {iteration})...[/dim]")
+        await self._render_events(pending)
+        return continuation
 
-        elif event.type == AgentEvent.TOOL_CALL:
-            tool_name = event.data.get("tool", "unknown")
-            tool_args = event.data.get("args", {})
-            args_str = ", ".join(f"{k}={repr(v)[:30]}" for k, v in tool_args.items()) if tool_args else ""
-            messages.write(f"[bold magenta]🔧 Calling:[/bold magenta] [cyan]{tool_name}[/cyan]({args_str})")
+    async def _render_events(self, events: List[AgentEvent]) -> None:
+        """Handle non-interactive events, flushing their output in one log write."""
+        if not events:
+            return
+        self._write_buffer = []
+        try:
+            with self.app.batch_update():
+                for event in events:
+                    await self._handle_agent_event(event)
+        finally:
+            buffered, self._write_buffer = self._write_buffer, None
+            if buffered:
+                self._write("\n".join(buffered))
 
-        elif event.type == AgentEvent.TOOL_RESULT:
-            tool_name = event.data.get("tool", "unknown")
-            result = event.data.get("result", "")
-            result_preview = self._format_tool_result(tool_name, result)
-            messages.write(f"[dim]   ↳ {result_preview}[/dim]")
+    async def _handle_agent_event(self, event: AgentEvent) -> None:
+        """Handle a single agent event."""
+        handler = self._event_handlers.get(event.type)
+        if handler:
+            await handler(event)
+
+    async def _on_thinking(self, event: AgentEvent) -> None:
+        """Show the step counter for follow-up reasoning iterations."""
+        iteration = event.data.get("iteration", 1)
+        if iteration > 1:
+            self._write(_THINKING_STEP_FMT % iteration)
+
+    async def _on_tool_call(self, event: AgentEvent) -> None:
+        """Show the tool being called with a short preview of its args."""
+        tool_name = event.data.get("tool", "unknown")
+        tool_args = event.data.get("args", {})
+        # Most tool calls take zero or one argument; skip the join for those
+        if not tool_args:
+            args_str = ""
+        elif len(tool_args) == 1:
+            k, v = next(iter(tool_args.items()))
+            args_str = f"{k}={_ARG_REPR.repr(v)}"
+        else:
+            args_str = ", ".join(f"{k}={_ARG_REPR.repr(v)}" for k, v in tool_args.items())
+        self._write(_TOOL_CALL_FMT % (tool_name, args_str))
+
+    async def _on_tool_result(self, event: AgentEvent) -> None:
+        """Show a one-line preview of a tool result."""
+        tool_name = event.data.get("tool", "unknown")
+        result = event.data.get("result", "")
+        result_preview = self._format_tool_result(tool_name, result)
+        self._write(_TOOL_RESULT_FMT % _truncate(result_preview))
+
+    async def _on_approval_needed(self, event: AgentEvent) -> AsyncIterator[AgentEvent]:
+        """Ask the user to approve a query and return the agent's continuation."""
+        sql = event.data.get("sql", "")
+
+        self._write_block([
+            "\n[bold yellow]📋 SQL Query Requires Approval:[/bold yellow]",
+            f"```sql\n{_truncate(sql)}\n```",
+        ])
+
+        # Highlight in a thread so pygments doesn't stall the UI, then show the modal
+        highlighted = await asyncio.to_thread(highlight_sql, sql)
+        approved = await self.app.push_screen_wait(
+            QueryApprovalModal(sql, highlighted)
+        )
 
-        elif event.type == AgentEvent.APPROVAL_NEEDED:
-            sql = event.data.get("sql", "")
+        if approved:
+            self._write("\n[green]✓ Query approved - executing...[/green]")
+        else:
+            self._write("\n[red]✗ Query rejected[/red]")
+
+        # Continue after approval
+        return self.agent.continue_after_approval(
+            approved=approved,
+            sql=sql,
+            tool_call_id=event.data.get("tool_call_id", ""),
+            state=event.data
+        )
 
-            messages.write(f"\n[bold yellow]📋 SQL Query Requires Approval:[/bold yellow]")
-            messages.write(f"```sql\n{sql}\n```")
+    async def _on_response(self, event: AgentEvent) -> None:
+        """Show the final answer and keep the conversation state."""
+        content = event.data.get("content", "")
+        # The full content stays in agent_state; only the display is capped
+        self._write(f"\n[bold yellow]Agent:[/bold yellow]\n{_truncate(content)}")
+        self.agent_state = event.data.get("state", self.agent_state)
+
+        if self._pending_question and content:
+            question, scope = self._pending_question
+            self.response_cache.put(question, scope, content)
+
+    async def _on_error(self, event: AgentEvent) -> None:
+        """Show an agent error."""
+        error = event.data.get("error", "Unknown error")
+        self._write(f"\n[bold red]Error:[/bold red] {_truncate(error)}")
+
+    def _cache_scope(self) -> tuple:
+        """Identify the connected database and the conversation so far for the response cache."""
+        params = self.db_tools.connection_params or {}
+        history = self.agent.get_conversation_history(self.agent_state) if self.agent_state else []
+        digest = hashlib.blake2b(repr(history).encode("utf-8"), digest_size=16).hexdigest()
+        return tuple(params.get(k) for k in ("host", "port", "database", "user")) + (digest,)
+
+    def _write(self, text: str) -> None:
+        """Write to the log, or to the pending batch while one is being collected."""
+        if self._write_buffer is not None:
+            self._write_buffer.append(text)
+            return
 
-            # Show approval modal
-            approved = await self.app.push_screen_wait(
-                QueryApprovalModal(sql)
-            )
+        self._messages.write(text)
 
-            if approved:
-                messages.write("\n[green]✓ Query approved - executing...[/green]")
-            else:
-                messages.write("\n[red]✗ Query rejected[/red]")
-
-            # Continue after approval
-            async for post_event in self.agent.continue_after_approval(
-                approved=approved,
-                sql=sql,
-                tool_call_id=event.data.get("tool_call_id", ""),
-                state=event.data
-            ):
-                await self._handle_agent_event(post_event, messages)
-
-        elif event.type == AgentEvent.RESPONSE:
-            content = event.data.get("content", "")
-            messages.write(f"\n[bold yellow]Agent:[/bold yellow]\n{content}")
-            self.agent_state = event.data.get("state", self.agent_state)
-
-        elif event.type == AgentEvent.ERROR:
-            error = event.data.get("error", "Unknown error")
-            messages.write(f"\n[bold red]Error:[/bold red] {error}")
+    def _write_block(self, lines: List[str]) -> None:
+        """Write several lines with a single RichLog.write (one layout/scroll pass)."""
+        self._write("\n".join(lines))
 
     def _format_tool_result(self, tool_name: str, result) -> str:
-        """Format tool result for display."""
+        """Format tool result for display, reusing previews of repeated results."""
+        if not isinstance(result, str):
+            return self._build_tool_preview(tool_name, result)
+
+        key = (tool_name, hash(result))
+        preview = self._preview_cache.get(key)
+        if preview is not None:
+            self._preview_cache.move_to_end(key)
+            return preview
+
+        preview = self._build_tool_preview(tool_name, result)
+        self._preview_cache[key] = preview
+        if len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        return preview
+
+    def _build_tool_preview(self, tool_name: str, result) -> str:
+        """Build the one-line preview for a tool result."""
         if isinstance(result, str):
+            # Only decode strings that look like JSON and are small enough
+            # that parsing them for a one-line preview is worthwhile
+            if len(result) > _MAX_PARSE_CHARS or not _JSON_START_RE.match(result):
+                return result[:150] + "..." if len(result) > 150 else result
             try:
-                result = json.loads(result)
-            except:
+                result = _json.loads(result)
+            except ValueError:  # JSONDecodeError of both orjson and json
                 return result[:150] + "..." if len(result) > 150 else result
 
         if isinstance(result, dict):
             if "error" in result:
                 return f"❌ {result['error']}"
 
-            if tool_name == "list_schemas":
-                schemas = result.get("schemas", [])
-                return f"Found {len(schemas)} schemas: {', '.join(schemas[:5])}"
-
-            elif tool_name == "list_tables":
-                tables = result.get("tables", [])
-                names = [t.get("name", t) if isinstance(t, dict) else t for t in tables[:5]]
-                more = f"... (+{len(tables) - 5} more)" if len(tables) > 5 else ""
-                return f"Found {len(tables)} tables: {', '.join(names)}{more}"
-
-            elif tool_name == "inspect_schema":
-                columns = result.get("columns", [])
-                col_names = [c.get("name", c) if isinstance(c, dict) else c for c in columns[:3]]
-                return f"Found {len(columns)} columns: {', '.join(col_names)}..."
-
-            elif tool_name == "get_table_relationships":
-                fks = result.get("foreign_keys", [])
-                refs = result.get("referenced_by", [])
-                return f"Found {len(fks)} foreign keys, {len(refs)} references"
-
-            elif tool_name == "validate_sql":
-                return "✓ SQL is valid" if result.get("valid") else f"❌ {result.get('error', 'Invalid')}"
-
-            elif tool_name == "execute_query":
-                rows = result.get("rows", [])
-                if rows:
-                    # Show preview of first row
-                    first_row = rows[0]
-                    preview = str(first_row)[:80] + "..." if len(str(first_row)) > 80 else str(first_row)
-                    return f"Query returned {len(rows)} rows. First: {preview}"
-                return f"Query returned {len(rows)} rows"
+            formatter = _TOOL_PREVIEWS.get(tool_name)
+            if formatter:
+                return formatter(result)
 
         return str(result)[:150]
 
     async def handle_command(self, command: str) -> None:
         """Handle slash commands."""
-        messages = self.query_one("#messages", RichLog)
         cmd = command.split(maxsplit=1)[0].lower()
 
         if cmd == "/help":
@@ -238,89 +562,90 @@ class ChatView(Widget):
         elif cmd == "/status":
             self._show_status()
         elif cmd == "/clear":
-            messages.clear()
-            self.agent_state = None
-            messages.write("[green]✓ Chat cleared[/green]")
+            # Clear and confirm in a single refresh
+            with self.app.batch_update():
+                self._messages.clear()
+                self.agent_state = None
+                self._write("[green]✓ Chat cleared[/green]")
         else:
-            messages.write(f"[red]Unknown command: {cmd}[/red]")
-            messages.write("[dim]Type /help for available commands[/dim]")
+            self._write_block([
+                f"[red]Unknown command: {cmd}[/red]",
+                "[dim]Type /help for available commands[/dim]",
+            ])
 
     def _show_help(self) -> None:
         """Show help message."""
-        messages = self.query_one("#messages", RichLog)
-        messages.write("\n[bold]Available Commands:[/bold]")
-        messages.write("  [cyan]/models[/cyan] - Configure LLM provider")
-        messages.write("  [cyan]/db[/cyan] - Connect to PostgreSQL database")
-        messages.write("  [cyan]/status[/cyan] - Show current status")
-        messages.write("  [cyan]/clear[/cyan] - Clear chat history")
-        messages.write("  [cyan]/help[/cyan] - Show this help")
-        messages.write("\n[bold]How It Works:[/bold]")
-        messages.write("  The agent thinks step-by-step and uses tools dynamically.")
-        messages.write("  It will explore the database, run queries, and adapt based on results.")
-        messages.write("  SQL queries require your approval before execution.")
-        messages.write("\n[bold]Example Queries:[/bold]")
-        messages.write("  - What tables are in the database?")
-        messages.write("  - How many users are there?")
-        messages.write("  - Show me 5 messages from the messages table")
-        messages.write("  - What are the relationships between tables?")
+        self._write(_HELP_TEXT)
 
     async def _configure_models(self) -> None:
         """Configure LLM provider."""
-        messages = self.query_one("#messages", RichLog)
-
         config = await self.app.push_screen_wait(ModelsConfigModal())
 
         if config:
             try:
                 self.config = config
-                self.agent = SQLAgent.create_agent(
+                # Provider setup can import SDKs and build HTTP clients; keep
+                # it off the event loop so the UI stays responsive.
+                self.agent = await asyncio.to_thread(
+                    SQLAgent.create_agent,
                     provider=config["provider"],
                     api_key=config["api_key"],
                     model=config["model"],
                     db_tools=self.db_tools
                 )
 
-                self.query_one("#provider-status", Label).update(f"Provider: {config['provider'].title()}")
-                self.query_one("#model-status", Label).update(f"Model: {config['model']}")
+                self._provider_label.update(f"Provider: {config['provider'].title()}")
+                self._model_label.update(f"Model: {config['model']}")
 
-                messages.write(f"\n[green]✓ LLM configured: {config['provider']} / {config['model']}[/green]")
-                messages.write("[dim]Use /db to connect to a database.[/dim]")
+                self._write_block([
+                    f"\n[green]✓ LLM configured: {config['provider']} / {config['model']}[/green]",
+                    "[dim]Use /db to connect to a database.[/dim]",
+                ])
 
             except Exception as e:
-                messages.write(f"\n[red]❌ Error: {str(e)}[/red]")
+                self._write(f"\n[red]❌ Error: {str(e)}[/red]")
         else:
-            messages.write("\n[dim]Configuration cancelled[/dim]")
+            self._write("\n[dim]Configuration cancelled[/dim]")
 
-        self.query_one("#user-input", Input).focus()
+        self._input.focus()
 
     async def _configure_database(self) -> None:
         """Configure database connection."""
-        messages = self.query_one("#messages", RichLog)
-
         connected = await self.app.push_screen_wait(DatabaseConfigModal(self.db_tools))
 
         if connected:
             db_name = self.db_tools.connection_params.get("database", "Unknown")
-            self.query_one("#db-status", Label).update(f"DB: {db_name}")
-            messages.write(f"\n[green]✓ Connected to: {db_name}[/green]")
+            self._db_label.update(f"DB: {db_name}")
+            self._write(f"\n[green]✓ Connected to: {db_name}[/green]")
         else:
-            messages.write("\n[dim]Configuration cancelled[/dim]")
+            self._write("\n[dim]Configuration cancelled[/dim]")
 
-        self.query_one("#user-input", Input).focus()
+        self._input.focus()
 
     def _show_status(self) -> None:
         """Show current status."""
-        messages = self.query_one("#messages", RichLog)
-        messages.write("\n[bold]Current Status:[/bold]")
+        # The block only changes when the agent, config or connection object
+        # is replaced, so reuse the last rendering until one of them is
+        state = (self.agent, self.config, self.db_tools.connection_params)
+        cached = self._status_cache
+        if cached is None or any(old is not new for old, new in zip(cached[0], state)):
+            self._status_cache = (state, self._build_status())
+        self._write(self._status_cache[1])
+
+    def _build_status(self) -> str:
+        """Build the /status block."""
+        lines = ["\n[bold]Current Status:[/bold]"]
 
         if self.agent and self.config:
-            messages.write(f"  [green]✓[/green] LLM: {self.config['provider']} / {self.config['model']}")
+            lines.append(f"  [green]✓[/green] LLM: {self.config['provider']} / {self.config['model']}")
         else:
-            messages.write("  [red]✗[/red] LLM: Not configured (use /models)")
+            lines.append("  [red]✗[/red] LLM: Not configured (use /models)")
 
         if self.db_tools.connection_params:
             db_name = self.db_tools.connection_params.get("database", "Unknown")
             db_host = self.db_tools.connection_params.get("host", "Unknown")
-            messages.write(f"  [green]✓[/green] Database: {db_name} @ {db_host}")
+            lines.append(f"  [green]✓[/green] Database: {db_name} @ {db_host}")
         else:
-            messages.write("  [red]✗[/red] Database: Not connected (use /db)")
+            lines.append("  [red]✗[/red] Database: Not connected (use /db)")
+
+        return "\n".join(lines)
@@ -0,0 +1,47 @@
+"""Scrollback log widget for the SQL Agent TUI chat view."""
+
+from textual.widgets import RichLog
+
+
+class MessageLog(RichLog):
+    """RichLog that trims its scrollback in batches.
+
+    RichLog already renders only the lines inside the viewport (each write is
+    turned into cached strips once), so frame cost does not grow with history.
+    What does grow is the write path once ``max_lines`` is reached: RichLog
+    re-slices the whole line list on every write. MessageLog lets the log
+    overshoot by ``trim_batch`` lines and then drops the excess in one go,
+    making trimming amortized O(1) per written line.
+
+    The trim itself is left to RichLog: ``max_lines`` is set only for the
+    write that crosses the overshoot, so no RichLog internals are touched.
+
+    Right after a trim, ``trim_marker`` (if given) is written unless an
+    earlier marker is still in the log, so the marker only ever appears
+    once output has really been dropped.
+    """
+
+    def __init__(self, *, max_lines: int, trim_batch: int = 200, trim_marker=None, **kwargs):
+        super().__init__(max_lines=None, **kwargs)
+        self.scrollback = max_lines
+        self.trim_batch = trim_batch
+        self.trim_marker = trim_marker
+        # Last line of the most recent marker, to tell whether it was trimmed away
+        self._marker_line = None
+
+    def write(self, content, *args, **kwargs) -> "MessageLog":
+        trimming = len(self.lines) >= self.scrollback + self.trim_batch
+        if trimming:
+            self.max_lines = self.scrollback
+        try:
+            super().write(content, *args, **kwargs)
+        finally:
+            self.max_lines = None
+
+        # A deferred write (size not known yet) adds and trims nothing
+        if trimming and len(self.lines) <= self.scrollback and self.trim_marker is not None:
+            if not any(line is self._marker_line for line in self.lines):
+                super().write(self.trim_marker)
+                self._marker_line = self.lines[-1]
+
+        return self
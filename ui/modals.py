@@ -4,25 +4,78 @@ from textual.screen import ModalScreen
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.widgets import Button, Input, Label, Static, ListView, ListItem
 from textual.app import ComposeResult
+from textual.timer import Timer
 from textual.worker import Worker
+from rich.padding import Padding
 from rich.syntax import Syntax
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Tuple
+from functools import lru_cache, partial
+import asyncio
 
 from api_models import ModelFetcher, get_fallback_models
 from tools import PostgreSQLTools
 from config import get_config
-from .styles import MODAL_STYLES
+from .styles import COMMON_MODAL_CSS, DB_MODAL_CSS, MODELS_MODAL_CSS, APPROVAL_MODAL_CSS
+
+
+# Provider clicks closer together than this (seconds) trigger a single model fetch
+FETCH_DEBOUNCE_SECONDS = 0.15
+
+# Provider name -> selector of its button in ModelsConfigModal
+PROVIDER_BUTTONS = {
+    "google": "#provider-google",
+    "openai": "#provider-openai",
+    "anthropic": "#provider-anthropic",
+}
+
+
+# Pygments theme for SQL shown in QueryApprovalModal
+SQL_THEME = "monokai"
+
+
+@lru_cache(maxsize=64)
+def highlight_sql(sql: str) -> Padding:
+    """
+    Syntax-highlight SQL for the approval dialog.
+
+    Pygments tokenization is the slow part of showing the dialog, so this
+    can run off the event loop before the modal is pushed. The result renders
+    the same as Syntax(sql, "sql", theme=SQL_THEME).
+
+    Args:
+        sql: SQL query text
+
+    Returns:
+        Highlighted query, padded to full width with the theme background
+    """
+    syntax = Syntax(sql, "sql", theme=SQL_THEME, line_numbers=False)
+    text = syntax.highlight(sql)
+    # highlight() always ends with a newline; Syntax drops the added one
+    if not sql.endswith("\n"):
+        text.right_crop(1)
+    background = Syntax.get_theme(SQL_THEME).get_background_style()
+    return Padding(text, 0, style=background, expand=True)
 
 
 class DatabaseConfigModal(ModalScreen[bool]):
     """Modal screen for PostgreSQL database configuration."""
 
-    DEFAULT_CSS = MODAL_STYLES
+    DEFAULT_CSS = COMMON_MODAL_CSS + DB_MODAL_CSS
 
     def __init__(self, db_tools: PostgreSQLTools):
         super().__init__()
         self.db_tools = db_tools
 
+        # Widget references, resolved once in on_mount
+        self._host_in: Optional[Input] = None
+        self._port_in: Optional[Input] = None
+        self._database_in: Optional[Input] = None
+        self._user_in: Optional[Input] = None
+        self._password_in: Optional[Input] = None
+        self._error_msg: Optional[Static] = None
+        self._success_msg: Optional[Static] = None
+        self._action_btns: Tuple[Button, ...] = ()
+
     def compose(self) -> ComposeResult:
         with Container(id="db-dialog"):
             yield Label("🗄️  PostgreSQL Database Configuration", classes="config-title")
@@ -66,93 +119,128 @@ class DatabaseConfigModal(ModalScreen[bool]):
                 classes="field-input"
             )
 
-            yield Static("", id="error-msg")
-            yield Static("", id="success-msg")
+            yield Static("", id="error-msg", classes="status-msg -error")
+            yield Static("", id="success-msg", classes="status-msg -success")
 
             with Horizontal(id="button-container"):
                 yield Button("Test Connection", variant="default", id="test-btn", classes="modal-button")
                 yield Button("✓ Connect", variant="success", id="connect-btn", classes="modal-button")
                 yield Button("✗ Cancel", variant="error", id="cancel-btn", classes="modal-button")
 
+    def on_mount(self) -> None:
+        """Cache the form widgets."""
+        self._host_in = self.query_one("#host-input", Input)
+        self._port_in = self.query_one("#port-input", Input)
+        self._database_in = self.query_one("#database-input", Input)
+        self._user_in = self.query_one("#user-input", Input)
+        self._password_in = self.query_one("#password-input", Input)
+        self._error_msg = self.query_one("#error-msg", Static)
+        self._success_msg = self.query_one("#success-msg", Static)
+        self._action_btns = (
+            self.query_one("#test-btn", Button),
+            self.query_one("#connect-btn", Button),
+        )
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel-btn":
             self.dismiss(False)
         elif event.button.id == "test-btn":
-            self._test_connection()
+            self.run_worker(self._test_connection(), name="db_connect", exclusive=True)
         elif event.button.id == "connect-btn":
-            self._connect()
+            self.run_worker(self._connect(), name="db_connect", exclusive=True)
 
-    def _test_connection(self) -> None:
+    async def _test_connection(self) -> None:
         """Test database connection."""
-        error_msg = self.query_one("#error-msg", Static)
-        success_msg = self.query_one("#success-msg", Static)
-        error_msg.update("")
-        success_msg.update("")
+        params = self._read_form()
+        if params is None:
+            return
 
-        # Get values
-        host = self.query_one("#host-input", Input).value.strip()
-        port_str = self.query_one("#port-input", Input).value.strip()
-        database = self.query_one("#database-input", Input).value.strip()
-        user = self.query_one("#user-input", Input).value.strip()
-        password = self.query_one("#password-input", Input).value
+        # Test connection
+        result, _ = await self._connect_in_background(*params)
 
-        # Validate
-        if not all([host, port_str, database, user, password]):
-            error_msg.update("❌ All fields are required")
-            return
+        if result["success"]:
+            self._success_msg.update(f"✓ {result['message']}")
+        else:
+            self._error_msg.update(f"❌ {result['error']}")
 
-        try:
-            port = int(port_str)
-        except ValueError:
-            error_msg.update("❌ Port must be a number")
+    async def _connect(self) -> None:
+        """Connect and close modal."""
+        params = self._read_form()
+        if params is None:
             return
 
-        # Test connection
-        result = self.db_tools.connect(host, port, database, user, password)
+        # Connect
+        result, tools = await self._connect_in_background(*params)
+
+        # Cancel may have closed the dialog while the connect ran
+        if not self.is_attached:
+            return
 
         if result["success"]:
-            success_msg.update(f"✓ {result['message']}")
+            self.db_tools.use_connection(tools)
+            self.dismiss(True)
         else:
-            error_msg.update(f"❌ {result['error']}")
+            self._error_msg.update(f"❌ {result['error']}")
 
-    def _connect(self) -> None:
-        """Connect and close modal."""
-        error_msg = self.query_one("#error-msg", Static)
-        success_msg = self.query_one("#success-msg", Static)
-        error_msg.update("")
-        success_msg.update("")
+    def _read_form(self) -> Optional[Tuple[str, int, str, str, str]]:
+        """
+        Read and validate the connection form.
+
+        Returns:
+            (host, port, database, user, password), or None after showing
+            a validation error
+        """
+        self._error_msg.update("")
+        self._success_msg.update("")
 
         # Get values
-        host = self.query_one("#host-input", Input).value.strip()
-        port_str = self.query_one("#port-input", Input).value.strip()
-        database = self.query_one("#database-input", Input).value.strip()
-        user = self.query_one("#user-input", Input).value.strip()
-        password = self.query_one("#password-input", Input).value
+        host = self._host_in.value.strip()
+        port_str = self._port_in.value.strip()
+        database = self._database_in.value.strip()
+        user = self._user_in.value.strip()
+        password = self._password_in.value
 
         # Validate
         if not all([host, port_str, database, user, password]):
-            error_msg.update("❌ All fields are required")
-            return
+            self._error_msg.update("❌ All fields are required")
+            return None
 
         try:
             port = int(port_str)
         except ValueError:
-            error_msg.update("❌ Port must be a number")
-            return
-
-        # Connect
-        result = self.db_tools.connect(host, port, database, user, password)
-
-        if result["success"]:
-            self.dismiss(True)
-        else:
-            error_msg.update(f"❌ {result['error']}")
+            self._error_msg.update("❌ Port must be a number")
+            return None
+
+        return host, port, database, user, password
+
+    async def _connect_in_background(
+        self, host: str, port: int, database: str, user: str, password: str
+    ) -> Tuple[Dict[str, Any], PostgreSQLTools]:
+        """
+        Connect in a thread, keeping the dialog responsive meanwhile.
+
+        The attempt runs on a scratch PostgreSQLTools, so the app's
+        connection only changes once _connect() adopts it.
+
+        Returns:
+            (connect result, the scratch tools instance)
+        """
+        self._success_msg.update("⏳ Connecting...")
+        for btn in self._action_btns:
+            btn.disabled = True
+        tools = PostgreSQLTools(schema_cache=self.db_tools.schema_cache)
+        try:
+            return await tools.connect_async(host, port, database, user, password), tools
+        finally:
+            self._success_msg.update("")
+            for btn in self._action_btns:
+                btn.disabled = False
 
 
 class ModelsConfigModal(ModalScreen[Dict[str, str]]):
     """Modal screen for LLM provider configuration."""
 
-    DEFAULT_CSS = MODAL_STYLES
+    DEFAULT_CSS = COMMON_MODAL_CSS + MODELS_MODAL_CSS
 
     def __init__(self):
         super().__init__()
@@ -160,7 +248,22 @@ class ModelsConfigModal(ModalScreen[Dict[str, str]]):
         self.selected_provider = self.config.get_last_provider() or "google"
         self.selected_model = ""
         self.available_models: List[str] = []
-        self.fetching_models = False
+
+        # Widget references and button dispatch, built once in on_mount
+        self._provider_btns: Dict[str, Button] = {}
+        self._btn_handlers: Dict[str, Callable[[], None]] = {}
+        self._api_key_in: Optional[Input] = None
+        self._model_status: Optional[Static] = None
+        self._model_list: Optional[ListView] = None
+        self._error_msg: Optional[Static] = None
+        self._fetch_timer: Optional[Timer] = None
+
+        # Model list items are kept across refreshes; only their labels change
+        self._model_labels: List[Label] = []
+        self._shown_models: List[str] = []
+
+        # Provider -> saved API key, read from the config at most once per provider
+        self._apikey_cache: Dict[str, Optional[str]] = {}
 
     def compose(self) -> ComposeResult:
         with Container(id="models-dialog"):
@@ -168,7 +271,7 @@ class ModelsConfigModal(ModalScreen[Dict[str, str]]):
 
             yield Label("Select Provider:", classes="field-label")
             with Horizontal():
-                yield Button("Google Gemini", id="provider-google", classes="provider-btn provider-selected")
+                yield Button("Google Gemini", id="provider-google", classes="provider-btn is-selected")
                 yield Button("OpenAI", id="provider-openai", classes="provider-btn")
                 yield Button("Anthropic", id="provider-anthropic", classes="provider-btn")
 
@@ -186,7 +289,7 @@ class ModelsConfigModal(ModalScreen[Dict[str, str]]):
             # Scrollable list view for models
             yield ListView(id="model-list")
 
-            yield Static("", id="error-msg")
+            yield Static("", id="error-msg", classes="status-msg -error")
 
             with Horizontal(id="button-container"):
                 yield Button("🔄 Refresh Models", variant="default", id="refresh-btn", classes="modal-button")
@@ -195,61 +298,62 @@ class ModelsConfigModal(ModalScreen[Dict[str, str]]):
 
     def on_mount(self) -> None:
         """Initialize model buttons."""
-        # Restore last selected provider
-        provider_buttons = {
-            "google": "#provider-google",
-            "openai": "#provider-openai",
-            "anthropic": "#provider-anthropic"
+        self._provider_btns = {
+            provider: self.query_one(btn_id, Button)
+            for provider, btn_id in PROVIDER_BUTTONS.items()
+        }
+        self._api_key_in = self.query_one("#api-key-input", Input)
+        self._model_status = self.query_one("#model-status", Static)
+        self._model_list = self.query_one("#model-list", ListView)
+        self._error_msg = self.query_one("#error-msg", Static)
+
+        # Button id -> handler, including one entry per provider button
+        self._btn_handlers = {
+            "cancel-btn": lambda: self.dismiss(None),
+            "save-btn": self._save_config,
+            "refresh-btn": lambda: self._fetch_models(force_api=True),
         }
+        for provider, btn in self._provider_btns.items():
+            self._btn_handlers[btn.id] = partial(self._select_provider, provider)
 
-        for provider, btn_id in provider_buttons.items():
-            btn = self.query_one(btn_id, Button)
-            if provider == self.selected_provider:
-                btn.add_class("provider-selected")
-            else:
-                btn.remove_class("provider-selected")
+        # Restore last selected provider
+        self._highlight_provider()
 
         # Load saved API key if available
-        saved_api_key = self.config.get_api_key(self.selected_provider)
+        saved_api_key = self._saved_api_key(self.selected_provider)
         if saved_api_key:
-            self.query_one("#api-key-input", Input).value = saved_api_key
+            self._api_key_in.value = saved_api_key
 
         # Fetch models
         self._fetch_models()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id
+        handler = self._btn_handlers.get(event.button.id)
+        if handler:
+            handler()
 
-        if button_id == "cancel-btn":
-            self.dismiss(None)
+    def _select_provider(self, provider: str) -> None:
+        """Switch to another provider and load its key and models."""
+        self.selected_provider = provider
+        self._highlight_provider()
 
-        elif button_id == "save-btn":
-            self._save_config()
+        # Load saved API key for this provider
+        saved_api_key = self._saved_api_key(self.selected_provider)
+        self._api_key_in.value = saved_api_key or ""
 
-        elif button_id == "refresh-btn":
-            self._fetch_models(force_api=True)
-
-        elif button_id and button_id.startswith("provider-"):
-            # Provider selection
-            provider = button_id.replace("provider-", "")
-            self.selected_provider = provider
+        # Fetch models for new provider
+        self._fetch_models()
 
-            # Update button styles
-            for btn in self.query("Button.provider-btn"):
-                if btn.id == button_id:
-                    btn.add_class("provider-selected")
-                else:
-                    btn.remove_class("provider-selected")
+    def _saved_api_key(self, provider: str) -> Optional[str]:
+        """Get the saved API key for a provider, reading the config only once."""
+        if provider not in self._apikey_cache:
+            self._apikey_cache[provider] = self.config.get_api_key(provider)
+        return self._apikey_cache[provider]
 
-            # Load saved API key for this provider
-            saved_api_key = self.config.get_api_key(self.selected_provider)
-            if saved_api_key:
-                self.query_one("#api-key-input", Input).value = saved_api_key
-            else:
-                self.query_one("#api-key-input", Input).value = ""
-
-            # Fetch models for new provider
-            self._fetch_models()
+    def _highlight_provider(self) -> None:
+        """Mark the selected provider's button."""
+        for provider, btn in self._provider_btns.items():
+            btn.set_class(provider == self.selected_provider, "is-selected")
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle model selection from ListView."""
@@ -258,88 +362,110 @@ class ModelsConfigModal(ModalScreen[Dict[str, str]]):
         if list_view.index is not None and list_view.index < len(self.available_models):
             self.selected_model = self.available_models[list_view.index]
             # Update status to show selection
-            status = self.query_one("#model-status", Static)
-            status.update(f"✓ Selected: {self.selected_model}")
+            self._model_status.update(f"✓ Selected: {self.selected_model}")
 
     def _fetch_models(self, force_api: bool = False) -> None:
-        """Fetch models for selected provider."""
-        if self.fetching_models:
-            return
+        """Fetch models for selected provider, debounced across rapid clicks."""
+        self._model_status.update(f"⏳ Loading {self.selected_provider} models...")
+
+        # Only the last request in a burst of provider clicks starts a fetch
+        if self._fetch_timer is not None:
+            self._fetch_timer.stop()
+        self._fetch_timer = self.set_timer(
+            FETCH_DEBOUNCE_SECONDS,
+            partial(self._start_fetch, force_api)
+        )
 
-        self.fetching_models = True
-        status = self.query_one("#model-status", Static)
-        status.update(f"⏳ Loading {self.selected_provider} models...")
+    def _start_fetch(self, force_api: bool) -> None:
+        """Start the model fetch worker, replacing any fetch in flight."""
+        self._fetch_timer = None
+        provider = self.selected_provider
 
         # Get API key
-        api_key = self.query_one("#api-key-input", Input).value.strip() if force_api else None
+        api_key = self._api_key_in.value.strip() if force_api else None
         if not api_key:
-            api_key = self.config.get_api_key(self.selected_provider)
+            api_key = self._saved_api_key(provider)
 
         # Fetch models in background
         self.run_worker(
-            self._fetch_models_async(api_key),
+            self._fetch_models_async(provider, api_key),
             name="fetch_models",
             exclusive=True
         )
 
-    async def _fetch_models_async(self, api_key: Optional[str]) -> None:
+    async def _fetch_models_async(self, provider: str, api_key: Optional[str]) -> None:
         """Async worker to fetch models."""
         try:
             # Try to fetch from API
-            models = await ModelFetcher.fetch_all_models(self.selected_provider, api_key)
+            models = await ModelFetcher.fetch_all_models(provider, api_key)
 
             if not models:
                 # Use fallback
-                models = get_fallback_models(self.selected_provider)
+                models = get_fallback_models(provider)
 
-            self.available_models = models
+        except asyncio.CancelledError:
+            # A newer fetch replaced this one and will update the list
+            raise
 
-        except Exception as e:
+        except Exception:
             # Use fallback on error
-            self.available_models = get_fallback_models(self.selected_provider)
+            models = get_fallback_models(provider)
 
-        finally:
-            self.fetching_models = False
-            # Update UI - this runs automatically when worker completes
-            self._update_model_buttons()
+        self.available_models = models
+        self._update_model_buttons()
 
     def _update_model_buttons(self) -> None:
         """Update model list based on fetched models."""
-        list_view = self.query_one("#model-list", ListView)
-        status = self.query_one("#model-status", Static)
+        status = self._model_status
+        models = self.available_models
 
-        # Clear existing items
-        list_view.clear()
-
-        if not self.available_models:
-            status.update("❌ No models available")
-            return
+        # Reuse the existing list items, relabelling only those that changed
+        with self.app.batch_update():
+            self._sync_model_items(models)
 
-        status.update(f"✓ {len(self.available_models)} models available")
+            if not models:
+                status.update("❌ No models available")
+                return
 
-        # Get last used model for this provider
-        last_model = self.config.get_last_model(self.selected_provider)
-        if last_model and last_model in self.available_models:
-            self.selected_model = last_model
-        else:
-            self.selected_model = self.available_models[0] if self.available_models else ""
+            status.update(f"✓ {len(models)} models available")
 
-        # Add model items to ListView
-        for i, model in enumerate(self.available_models):
-            list_item = ListItem(Label(model))
-            list_view.append(list_item)
+            # Get last used model for this provider
+            last_model = self.config.get_last_model(self.selected_provider)
+            if last_model and last_model in models:
+                self.selected_model = last_model
+            else:
+                self.selected_model = models[0]
 
             # Highlight selected model
-            if model == self.selected_model:
-                list_view.index = i
+            self._model_list.index = models.index(self.selected_model)
+
+    def _sync_model_items(self, models: List[str]) -> None:
+        """Make the ListView show models, adding or removing items only as needed."""
+        list_view = self._model_list
+        labels = self._model_labels
+        shown = self._shown_models
+
+        for i, (label, model) in enumerate(zip(labels, models)):
+            if shown[i] != model:
+                label.update(model)
+
+        if len(models) > len(labels):
+            new_labels = [Label(model) for model in models[len(labels):]]
+            list_view.extend([ListItem(label) for label in new_labels])
+            labels.extend(new_labels)
+        elif len(models) < len(labels):
+            list_view.remove_items(range(len(models), len(labels)))
+            del labels[len(models):]
+
+        self._shown_models = list(models)
 
     def _save_config(self) -> None:
         """Save configuration."""
-        error_msg = self.query_one("#error-msg", Static)
+        error_msg = self._error_msg
         error_msg.update("")
 
         # Get API key
-        api_key = self.query_one("#api-key-input", Input).value.strip()
+        api_key = self._api_key_in.value.strip()
 
         if not api_key:
             error_msg.update("❌ Please enter an API key")
@@ -349,10 +475,14 @@ class ModelsConfigModal(ModalScreen[Dict[str, str]]):
             error_msg.update("❌ Please select a model")
             return
 
-        # Save to config
-        self.config.set_api_key(self.selected_provider, api_key)
-        self.config.set_last_provider(self.selected_provider)
-        self.config.set_last_model(self.selected_provider, self.selected_model)
+        # Save to config in a thread (owned by the app, since this screen is
+        # about to close) so the file write doesn't delay the dismiss
+        self._apikey_cache[self.selected_provider] = api_key
+        self.app.run_worker(
+            partial(self.config.save_model_selection, self.selected_provider, api_key, self.selected_model),
+            name="save_config",
+            thread=True
+        )
 
         config = {
             "provider": self.selected_provider,
@@ -366,18 +496,19 @@ class ModelsConfigModal(ModalScreen[Dict[str, str]]):
 class QueryApprovalModal(ModalScreen[bool]):
     """Modal for SQL query execution approval."""
 
-    DEFAULT_CSS = MODAL_STYLES
+    DEFAULT_CSS = COMMON_MODAL_CSS + APPROVAL_MODAL_CSS
 
-    def __init__(self, sql_query: str):
+    def __init__(self, sql_query: str, highlighted: Optional[Padding] = None):
         super().__init__()
         self.sql_query = sql_query
+        self.highlighted = highlighted
 
     def compose(self) -> ComposeResult:
         with Container(id="approval-dialog"):
             yield Label("⚠️  Query Execution Approval", classes="approval-title")
             yield Label("\nThe AI agent wants to execute this SQL query:\n")
             yield Static(
-                Syntax(self.sql_query, "sql", theme="monokai", line_numbers=False),
+                self.highlighted or highlight_sql(self.sql_query),
                 id="query-display"
             )
             yield Label("\nDo you approve this query?")